@@ -6,12 +6,52 @@ Creates compound clips for easy podcast editing workflow.
 """
 
 import os
+import re
 import sys
 import json
 import time
-import glob
+import hashlib
 import shutil
+import stat
 import tempfile
+import threading
+import wave
+import itertools
+import mmap
+from collections import defaultdict, namedtuple
+from functools import lru_cache
+from operator import itemgetter
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+import numpy as np
+
+try:
+    import orjson  # optional, much faster JSON parsing
+except ImportError:
+    orjson = None
+
+# Resolved script/module directories are remembered between runs to skip the stat probes
+PATH_CACHE = os.path.expanduser("~/.cache/davincigate/paths.json")
+
+def load_path_cache():
+    """Return the cached path lookups, or an empty dict if there is no usable cache."""
+    try:
+        with open(PATH_CACHE) as f:
+            cache = json.load(f)
+        return cache if isinstance(cache, dict) else {}
+    except (OSError, ValueError):
+        return {}
+
+def save_path_cache(cache, **entries):
+    """Merge entries into cache (as returned by load_path_cache) and write it; failures are ignored since the cache is only an optimization."""
+    cache.update(entries)
+    cache["mtime"] = time.time()
+    try:
+        os.makedirs(os.path.dirname(PATH_CACHE), exist_ok=True)
+        with open(PATH_CACHE, "w") as f:
+            json.dump(cache, f, indent=2)
+    except OSError:
+        pass
 
 # Add the detect_silence script to path
 try:
@@ -20,68 +60,89 @@ except NameError:
     # __file__ not available in DaVinci Resolve, try to find the script directory
     script_dir = os.path.dirname(os.path.abspath(sys.argv[0])) if sys.argv else os.getcwd()
 
-# Add multiple possible paths
-possible_paths = [
-    script_dir,
-    os.path.join(script_dir, "Utility"),
-    os.path.expanduser("~/Library/Application Support/Blackmagic Design/DaVinci Resolve/Fusion/Scripts/Utility"),
-    os.getcwd()
-]
-
-for path in possible_paths:
-    if os.path.exists(os.path.join(path, "detect_silence.py")):
-        sys.path.insert(0, path)
-        break
-else:
+def find_detect_silence(path_cache):
+    """Put the directory holding detect_silence.py on sys.path; False if it cannot be found.
+    
+    Called from main() rather than at import: spawned analysis workers re-import this module.
+    """
+    possible_paths = [
+        script_dir,
+        os.path.join(script_dir, "Utility"),
+        os.path.expanduser("~/Library/Application Support/Blackmagic Design/DaVinci Resolve/Fusion/Scripts/Utility"),
+        os.getcwd()
+    ]
+    
+    # The usual layout (detect_silence.py next to this script) needs one stat and no cache lookup
+    if os.path.isfile(os.path.join(script_dir, "detect_silence.py")):
+        if script_dir not in sys.path:
+            sys.path.insert(0, script_dir)
+        return True
+    
+    # Reuse the last answer for this script location while detect_silence.py is still there
+    cached_dir = path_cache.get("detect_silence_dir") if path_cache.get("script_dir") == script_dir else None
+    if cached_dir and os.path.isfile(os.path.join(cached_dir, "detect_silence.py")):
+        if cached_dir not in sys.path:
+            sys.path.insert(0, cached_dir)
+        return True
+    for path in possible_paths[1:]:
+        if os.path.isfile(os.path.join(path, "detect_silence.py")):
+            if path not in sys.path:
+                sys.path.insert(0, path)
+            save_path_cache(path_cache, script_dir=script_dir, detect_silence_dir=path)
+            return True
     print("ERROR: Could not find detect_silence.py in any of these locations:")
     for path in possible_paths:
         print(f"  - {path}")
-    sys.exit(1)
-
-try:
-    from detect_silence import detect_silence
-except ImportError as e:
-    print(f"ERROR: Could not import detect_silence.py: {e}")
-    sys.exit(1)
+    return False
 
 # --- Resolve API bootstrap (Cross-platform) ---
-candidates = []
-
-# Add environment variable path if set
-if os.environ.get("RESOLVE_SCRIPT_API"):
-    candidates.append(os.path.join(os.environ.get("RESOLVE_SCRIPT_API"), "Modules"))
-
-# macOS paths
-if sys.platform == "darwin":
-    candidates.extend([
-        "/Applications/DaVinci Resolve/DaVinci Resolve.app/Contents/Resources/Developer/Scripting/Modules",
-        "/Library/Application Support/Blackmagic Design/DaVinci Resolve/Developer/Scripting/Modules",
-        os.path.expanduser("~/Library/Application Support/Blackmagic Design/DaVinci Resolve/Developer/Scripting/Modules"),
-    ])
-# Windows paths
-elif sys.platform == "win32":
-    candidates.extend([
-        os.path.expanduser("~/AppData/Roaming/Blackmagic Design/DaVinci Resolve/Support/Developer/Scripting/Modules"),
-        "C:/Program Files/Blackmagic Design/DaVinci Resolve/Developer/Scripting/Modules",
-        "C:/Program Files (x86)/Blackmagic Design/DaVinci Resolve/Developer/Scripting/Modules",
-    ])
-# Linux paths
-elif sys.platform.startswith("linux"):
-    candidates.extend([
-        os.path.expanduser("~/.local/share/DaVinciResolve/Developer/Scripting/Modules"),
-        "/opt/resolve/Developer/Scripting/Modules",
-        "/usr/local/DaVinciResolve/Developer/Scripting/Modules",
-    ])
-for p in candidates:
-    if p and os.path.isdir(p) and p not in sys.path:
-        sys.path.append(p)
+def get_resolve(cache):
+    """Locate and import DaVinciResolveScript, then connect; cache is the loaded path cache."""
+    api_env = os.environ.get("RESOLVE_SCRIPT_API")
+    cached = cache.get("resolve_modules")
+    if cached and cache.get("resolve_script_api") == api_env and all(os.path.isdir(p) for p in cached):
+        for p in cached:
+            if p not in sys.path:
+                sys.path.append(p)
+        import DaVinciResolveScript as dvr
+        return dvr.scriptapp("Resolve")
+    
+    candidates = []
+
+    # Add environment variable path if set
+    if os.environ.get("RESOLVE_SCRIPT_API"):
+        candidates.append(os.path.join(os.environ.get("RESOLVE_SCRIPT_API"), "Modules"))
+
+    # macOS paths
+    if sys.platform == "darwin":
+        candidates.extend([
+            "/Applications/DaVinci Resolve/DaVinci Resolve.app/Contents/Resources/Developer/Scripting/Modules",
+            "/Library/Application Support/Blackmagic Design/DaVinci Resolve/Developer/Scripting/Modules",
+            os.path.expanduser("~/Library/Application Support/Blackmagic Design/DaVinci Resolve/Developer/Scripting/Modules"),
+        ])
+    # Windows paths
+    elif sys.platform == "win32":
+        candidates.extend([
+            os.path.expanduser("~/AppData/Roaming/Blackmagic Design/DaVinci Resolve/Support/Developer/Scripting/Modules"),
+            "C:/Program Files/Blackmagic Design/DaVinci Resolve/Developer/Scripting/Modules",
+            "C:/Program Files (x86)/Blackmagic Design/DaVinci Resolve/Developer/Scripting/Modules",
+        ])
+    # Linux paths
+    elif sys.platform.startswith("linux"):
+        candidates.extend([
+            os.path.expanduser("~/.local/share/DaVinciResolve/Developer/Scripting/Modules"),
+            "/opt/resolve/Developer/Scripting/Modules",
+            "/usr/local/DaVinciResolve/Developer/Scripting/Modules",
+        ])
+    found = [p for p in candidates if p and os.path.isdir(p)]
+    for p in found:
+        if p not in sys.path:
+            sys.path.append(p)
+    if found:
+        save_path_cache(cache, resolve_script_api=api_env, resolve_modules=found)
 
-try:
     import DaVinciResolveScript as dvr
-    resolve = dvr.scriptapp("Resolve")
-except Exception as e:
-    print(f"ERROR: DaVinci Resolve API not available: {e}")
-    sys.exit(1)
+    return dvr.scriptapp("Resolve")
 
 # Configuration
 RENDER_PRESET = "AudioOnly_IndividualClips"
@@ -114,9 +175,16 @@ try:
         "min_silence_ms": config.MIN_SILENCE_MS,
         "padding_ms": config.PADDING_MS,
         "hold_ms": config.HOLD_MS,
+        "silence_backend": getattr(config, "SILENCE_BACKEND", "numpy"),
         "crossfade_ms": config.CROSSFADE_MS,
         "batch_size": config.BATCH_SIZE,
         "fps_hint": config.FPS_HINT,
+        "skip_render": getattr(config, "SKIP_RENDER", False),
+        "keep_silence_clips": getattr(config, "KEEP_SILENCE_CLIPS", False),
+        "cache_decoded_audio": getattr(config, "CACHE_DECODED_AUDIO", False),
+        "max_json_age": config.MAX_JSON_AGE,
+        "force_reanalyze": getattr(config, "FORCE_REANALYZE", False),
+        "max_workers": getattr(config, "MAX_WORKERS", None),
         "script_dir": config.SCRIPT_DIR,
         "temp_dir": config.TEMP_DIR,
         "track_name_normalize": True,
@@ -134,31 +202,105 @@ except ImportError as e:
         "min_silence_ms": 600,
         "padding_ms": 120,
         "hold_ms": 500,
+        "silence_backend": "numpy",
         "crossfade_ms": 20,
         "batch_size": 250,
         "fps_hint": 30,
+        "skip_render": False,
+        "keep_silence_clips": False,
+        "cache_decoded_audio": False,
+        "max_json_age": 86400,
+        "force_reanalyze": False,
+        "max_workers": None,
         "script_dir": None,
         "temp_dir": None,
         "track_name_normalize": True,
         "use_compound_processing": True,
     }
 
-# Suppress pydub's ffmpeg warning since it's just informational
-import warnings
-warnings.filterwarnings("ignore", message="Couldn't find ffmpeg or avconv")
-warnings.filterwarnings("ignore", category=RuntimeWarning, module="pydub")
+# Read once; discover_hosts consults it for every clip
+NORMALIZE_NAMES = CONFIG.get("track_name_normalize", True)
+
+# Extra diagnostics (and the Resolve API calls they need) are opt-in
+DEBUG = bool(os.environ.get("DVG_DEBUG"))
+
+def dprint(*args, **kwargs):
+    """print() only when DVG_DEBUG is set; guard with `if DEBUG:` when building the message is costly."""
+    if DEBUG:
+        print(*args, **kwargs)
+
+# Working directory for renders and segment files; created by make_outdir() when main() runs,
+# so analysis workers that re-import this module do not each leave an empty temp dir behind
+OUTDIR = None
+
+def make_outdir():
+    """Create OUTDIR (the configured temp_dir, or a fresh temporary directory)."""
+    global OUTDIR
+    # Use temporary directory for safer handling
+    if CONFIG["temp_dir"]:
+        OUTDIR = CONFIG["temp_dir"]
+        os.makedirs(OUTDIR, exist_ok=True)
+    else:
+        OUTDIR = tempfile.mkdtemp(prefix="_temp_gate_")
+
+def _retry_remove(func, path, exc_info):
+    """rmtree onerror hook: clear read-only bits and retry briefly (AV scanners can hold files on Windows)."""
+    if not os.path.lexists(path):
+        return  # already removed, e.g. by the wav-cleanup thread
+    for delay in (0.1, 0.3, 1.0):
+        time.sleep(delay)
+        try:
+            mode = os.lstat(path).st_mode
+            # Only files need the read-only bit cleared; a directory keeps its r/x bits so it can still be listed
+            if not stat.S_ISDIR(mode) and not stat.S_ISLNK(mode):
+                os.chmod(path, mode | stat.S_IWRITE)
+            func(path)
+            return
+        except OSError:
+            continue
+
+def cleanup_outdir():
+    """Delete OUTDIR on a background thread so the final report is not held up by file removal."""
+    # Not a daemon: the interpreter still waits for the delete to finish before exiting
+    t = threading.Thread(target=shutil.rmtree, args=(OUTDIR,), kwargs={"onerror": _retry_remove}, name="outdir-cleanup")
+    t.start()
+    return t
 
-# Use temporary directory for safer handling
-if CONFIG["temp_dir"]:
-    OUTDIR = CONFIG["temp_dir"]
-    os.makedirs(OUTDIR, exist_ok=True)
-else:
-    OUTDIR = tempfile.mkdtemp(prefix="_temp_gate_")
+def remove_files_async(paths):
+    """Delete files on a background thread; anything left behind goes with the final OUTDIR cleanup."""
+    def remove_all():
+        for path in paths:
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+    t = threading.Thread(target=remove_all, name="wav-cleanup")
+    t.start()
+    return t
+
+_edit_page_ready = False
+
+def ensure_edit_page(resolve_obj):
+    """Switch to the Edit page once; later calls are free until another page is opened."""
+    global _edit_page_ready
+    if not _edit_page_ready:
+        resolve_obj.OpenPage("edit")
+        # Poll for the switch instead of a fixed sleep; the cap covers builds that report pages late
+        deadline = time.monotonic() + 0.5
+        while time.monotonic() < deadline:
+            try:
+                if resolve_obj.GetCurrentPage() == "edit":
+                    break
+            except:
+                # No GetCurrentPage to poll: fall back to the original fixed 0.5 s settle after the switch
+                time.sleep(0.5)
+                break
+            time.sleep(0.01)
+        _edit_page_ready = True
 
 def refresh_handles(resolve_obj):
     """Refresh object handles to stabilize the API."""
-    resolve_obj.OpenPage("edit")
-    time.sleep(0.5)
+    ensure_edit_page(resolve_obj)
     p = resolve_obj.GetProjectManager().GetCurrentProject()
     if not p:
         raise RuntimeError("Could not get current project")
@@ -170,87 +312,356 @@ def refresh_handles(resolve_obj):
         raise RuntimeError("Could not get media pool")
     return p, tl, mp
 
+# Audio track item lists keyed by track index; entries are dropped when a track changes
+_track_items_cache = {}
+
+def get_items(tl, idx):
+    """Return the items on an audio track, querying Resolve only once per track."""
+    items = _track_items_cache.get(idx)
+    if items is None:
+        items = _track_items_cache[idx] = tl.GetItemListInTrack("audio", idx) or []
+    return items
+
+def invalidate_items(idx=None):
+    """Forget the cached item list for one audio track, or for all tracks."""
+    if idx is None:
+        _track_items_cache.clear()
+    else:
+        _track_items_cache.pop(idx, None)
+
+# GetClipProperty("Frames") per media pool item: id(mpi) -> (mpi, frames); holding mpi keeps the id unique
+_frames_cache = {}
+
+def mpi_frames(mpi):
+    """Return a media pool item's length in frames (None if unknown), asking Resolve once per item."""
+    hit = _frames_cache.get(id(mpi))
+    if hit is not None:
+        return hit[1]
+    frames = None
+    try:
+        frames_str = (mpi.GetClipProperty("Frames") or "").strip()
+        if frames_str:
+            frames = int(float(frames_str))
+    except:
+        pass
+    _frames_cache[id(mpi)] = (mpi, frames)
+    return frames
+
+# Per-host Resolve reads (media pool item, timeline start/end), shared by source_range and the append passes
+_host_cache = {}
+
+def host_info(host):
+    """Return {"mpi", "start", "end"} for a host's timeline item, asking Resolve once per host per run."""
+    info = _host_cache.get(host["name"])
+    if info is None:
+        item = host["item"]
+        info = _host_cache[host["name"]] = {
+            "mpi": item.GetMediaPoolItem(),
+            "start": int(item.GetStart()),
+            "end": int(item.GetEnd()),
+        }
+    return info
+
+def snapshot_hosts(hosts):
+    """Fill host_info for every host up front, overlapping the Resolve calls across threads."""
+    def fetch(host):
+        try:
+            host_info(host)
+        except:
+            pass  # left uncached; the caller that needs it asks again and handles the error
+    with ThreadPoolExecutor(max_workers=max(1, min(FADE_WORKERS, len(hosts)))) as ex:
+        list(ex.map(fetch, hosts))
+
+@lru_cache(maxsize=2048)
 def normalize_name(raw):
-    base = raw.strip()
-    return base.title()
+    return raw.strip().title()
+
+# One segment to append; tuples are far lighter than dicts for thousands of segments
+ClipInfo = namedtuple("ClipInfo", "mediaPoolItem startFrame endFrame recordFrame trackIndex mediaType is_silence")
+
+def clip_payload(info):
+    """AppendToTimeline's dict form of a ClipInfo (a literal is cheaper than _asdict() or a template copy)."""
+    mpi, start, end, record, track, media_type, is_silence = info
+    return {"mediaPoolItem": mpi, "startFrame": start, "endFrame": end, "recordFrame": record,
+            "trackIndex": track, "mediaType": media_type, "trackType": "audio", "is_silence": is_silence}
+
+MIN_BATCH_SIZE = 16  # smallest chunk tried before giving up on the rest of a host
+_batch_size = None   # last chunk size Resolve accepted; later hosts start from it
+
+def _payloads(infos, start, size):
+    """AppendToTimeline dicts for infos[start:start+size]."""
+    return list(map(clip_payload, infos[start:start+size]))
 
 def append_in_chunks(infos, mp, size=None):
-    """Append timeline items in chunks to avoid large batch failures."""
+    """Append ClipInfo records in chunks, halving the chunk size whenever Resolve rejects one.
+    
+    Returns the appended items, which always line up with a prefix of infos: if even a
+    MIN_BATCH_SIZE chunk is rejected, nothing after it is appended.
+    """
+    global _batch_size
+    if not infos:
+        return []  # nothing to append: no API call and no cache invalidation
     if size is None:
-        size = CONFIG["batch_size"]
+        size = _batch_size or CONFIG["batch_size"]
     out = []
-    for i in range(0, len(infos), size):
-        chunk = infos[i:i+size]
-        result = mp.AppendToTimeline(chunk) or []
-        out.extend(result)
-        print(f">>> Appended chunk {i//size + 1}/{(len(infos) + size - 1)//size} ({len(chunk)} items)")
+    i = chunks = 0
+    # Double-buffered: the next chunk's dicts are built while Resolve is busy with the current one
+    with ThreadPoolExecutor(max_workers=1) as prep:
+        pending = prep.submit(_payloads, infos, i, size)
+        while i < len(infos):
+            payload = pending.result()
+            if i + len(payload) < len(infos):
+                pending = prep.submit(_payloads, infos, i + len(payload), size)
+            # AppendToTimeline wants dicts; convert only at the API boundary
+            result = mp.AppendToTimeline(payload) or []
+            if not result and size > MIN_BATCH_SIZE:
+                size = max(MIN_BATCH_SIZE, size // 2)
+                print(f">>> Append of {len(payload)} items failed, retrying in chunks of {size}")
+                pending = prep.submit(_payloads, infos, i, size)  # the prefetched chunk used the old size
+                continue
+            if not result:
+                # Skipping the chunk would shift every later item against its ClipInfo (fades, silence
+                # disabling), so stop this host here instead
+                print(f">>> WARNING: Resolve rejected segments {i + 1}-{i + len(payload)} of {len(infos)}; "
+                      f"the remaining {len(infos) - i} segments were not appended")
+                break
+            out.extend(result)
+            i += len(payload)
+            chunks += 1
+            dprint(f">>> Appended chunk {chunks} ({len(payload)} items, {i}/{len(infos)})")
+    _batch_size = size
+    for idx in {info.trackIndex for info in infos}:
+        invalidate_items(idx)
     return out
 
+FADE_WORKERS = 8  # concurrent SetProperty calls in flight per host
+COMPOUND_RETRY_DELAYS = (0, 0.1, 0.25)  # seconds to wait before each compound clip attempt
+
+# SetProperty call shapes for the two fade keys, in the order first tried; the one that works is remembered
+FADE_MODES = ("dict", "keys")
+_fade_mode = None  # None = no shape has worked yet; only a shape that worked is remembered
+
+def _set_fades(clip, fade_f, mode):
+    """Set AudioFadeIn/AudioFadeOut on one clip using one of FADE_MODES; returns True if accepted."""
+    if mode == "dict":
+        return bool(clip.SetProperty({"AudioFadeIn": fade_f, "AudioFadeOut": fade_f}))
+    if mode == "keys":
+        fade_in = clip.SetProperty("AudioFadeIn", fade_f)
+        return bool(clip.SetProperty("AudioFadeOut", fade_f) and fade_in)
+    return False
+
+# Ways to disable a silence clip, probed once like the fade shapes
+DISABLE_MODES = ("clip_enabled", "property")
+_disable_mode = None  # None = no call has worked yet; only a call that worked is remembered
+
+def _disable_clip(clip, mode):
+    """Disable one clip using one of DISABLE_MODES; returns True if accepted."""
+    if mode == "clip_enabled":
+        return bool(clip.SetClipEnabled(False))
+    if mode == "property":
+        return bool(clip.SetProperty("Enabled", False))
+    return False
+
+def _probe(clip, modes, call):
+    """Return the first mode for which call(clip, mode) succeeds, or "off"."""
+    for mode in modes:
+        try:
+            if call(clip, mode):
+                return mode
+        except:
+            pass
+    return "off"
+
+def _apply_fades(job):
+    """Set fades on one appended clip and disable it if it is silence; returns 1 if disabled."""
+    clip, is_silence, fade_f, fade_mode, disable_mode = job
+    # Both modes were probed up front, so one guard per clip covers the odd failing item
+    try:
+        if fade_mode != "off":
+            _set_fades(clip, fade_f, fade_mode)
+        return int(is_silence and _disable_clip(clip, disable_mode))
+    except:
+        return 0
+
+def apply_fades(items, clip_infos, fade_f):
+    """Apply fades and silence gating to appended clips concurrently; returns the disabled count."""
+    global _fade_mode, _disable_mode
+    if not items:
+        return 0
+    fade_mode, disable_mode = _fade_mode, _disable_mode
+    # items pair with the leading clip_infos; an append stopped early returns fewer
+    silence = [info.is_silence for info in clip_infos[:len(items)]]
+    if fade_mode is None:
+        # Probe on the first clip so the rest make one bridge call for both fades (or none at all).
+        # A rejection may just be that clip not being ready, so "off" holds for this call only
+        # and the next host probes again
+        fade_mode = _probe(items[0], FADE_MODES, lambda clip, mode: _set_fades(clip, fade_f, mode))
+        if fade_mode == "off":
+            print(">>> WARNING: Resolve rejected the audio fade properties; skipping crossfades for these clips")
+        else:
+            _fade_mode = fade_mode
+    if disable_mode is None and any(silence):
+        # Same as the fades: a rejection is not remembered, so the next host probes again
+        first = items[silence.index(True)]
+        disable_mode = _probe(first, DISABLE_MODES, _disable_clip)
+        if disable_mode == "off":
+            print(">>> WARNING: Resolve rejected disabling clips; these silence clips stay enabled")
+        else:
+            _disable_mode = disable_mode
+    if fade_mode == "off" and (disable_mode in (None, "off") or not any(silence)):
+        return 0  # no fades and nothing to disable: no bridge calls to make
+    repeat = itertools.repeat
+    with ThreadPoolExecutor(max_workers=FADE_WORKERS) as ex:
+        jobs = zip(items, silence, repeat(fade_f), repeat(fade_mode), repeat(disable_mode))
+        return sum(ex.map(_apply_fades, jobs))
+
 def discover_hosts(tl):
     """Find all audio tracks with clips in the timeline."""
     hosts = []
     seen = set()
     
-    for i in range(1, tl.GetTrackCount("audio") + 1):
-        items = tl.GetItemListInTrack("audio", i) or []
-        for item in items:
-            try:
-                name = item.GetName()
-                # Accept any non-empty track name
-                if name and name.strip():
-                    # Use the original name as the host name, or normalize if configured
-                    if CONFIG.get("track_name_normalize", True):
-                        host_name = normalize_name(name.strip())
-                    else:
-                        host_name = name.strip()
-                    
-                    # Skip if we've already seen this name
-                    if host_name not in seen:
-                        hosts.append({
-                            "name": host_name,
-                            "clip": name,
-                            "track": i,
-                            "item": item
-                        })
-                        seen.add(host_name)
-            except:
-                continue
+    # Fetch every track's item list concurrently (each is a blocking Resolve call), then walk them in track order
+    track_count = tl.GetTrackCount("audio")
+    with ThreadPoolExecutor(max_workers=max(1, min(FADE_WORKERS, track_count))) as ex:
+        lists = list(ex.map(lambda i: get_items(tl, i), range(1, track_count + 1)))
+    track_items = ((i, item) for i, items in enumerate(lists, 1) for item in items)
+    for i, item in track_items:
+        try:
+            name = item.GetName()
+        except:
+            continue
+        # Accept any non-empty track name
+        if not name:
+            continue
+        stripped = name.strip()
+        if not stripped:
+            continue
+        # Use the original name as the host name, or normalize if configured
+        host_name = normalize_name(stripped) if NORMALIZE_NAMES else stripped
+        # Skip if we've already seen this name
+        if host_name in seen:
+            continue
+        seen.add(host_name)
+        hosts.append({
+            "name": host_name,
+            "clip": name,
+            "track": i,
+            "item": item,
+            "json": os.path.join(OUTDIR, f"{host_name}.json")
+        })
     
     if not hosts:
         raise RuntimeError("No audio tracks with clips found. Please ensure your timeline has audio tracks with named clips.")
     return hosts
 
+MMAP_MIN_BYTES = 256 * 1024  # smaller files are cheaper to read() than to map
+
+def read_json(path):
+    """Parse a JSON file, using orjson when it is installed."""
+    with open(path, "rb") as f:
+        if orjson and os.fstat(f.fileno()).st_size > MMAP_MIN_BYTES:
+            # orjson parses straight from the mapped page cache, skipping the copy into a bytes object
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm, memoryview(mm) as view:
+                return orjson.loads(view)
+        raw = f.read()
+    return orjson.loads(raw) if orjson else json.loads(raw)
+
+SEGMENT_DTYPE = [("s", "f8"), ("e", "f8"), ("sil", "?")]
+
+def segment_arrays(segs, fps):
+    """Convert segment dicts to (startF, endF, is_silence) numpy arrays in one pass."""
+    # A file uses one schema throughout (detect_silence writes seconds), so check it once
+    has_frames = bool(segs) and "startF" in segs[0] and "endF" in segs[0]
+    start_key, end_key = ("startF", "endF") if has_frames else ("start_sec", "end_sec")
+    n = len(segs)
+    try:
+        # One C-level pass per column; detect_silence always writes every key
+        sF = np.fromiter(map(itemgetter(start_key), segs), dtype=np.float64, count=n)
+        eF = np.fromiter(map(itemgetter(end_key), segs), dtype=np.float64, count=n)
+        sil = np.fromiter(map(itemgetter("is_silence"), segs), dtype=bool, count=n)
+    except KeyError:
+        # Hand-edited files may omit keys; fill the defaults per segment
+        arr = np.fromiter(
+            ((s.get(start_key, 0), s.get(end_key, 0), s.get("is_silence", False)) for s in segs),
+            dtype=SEGMENT_DTYPE, count=n)
+        sF, eF, sil = arr["s"], arr["e"], arr["sil"]
+    if not has_frames:
+        sF, eF = sF * fps, eF * fps
+    # astype truncates toward zero, same as int()
+    return sF.astype(np.int64), eF.astype(np.int64), sil
+
+@lru_cache(maxsize=32)
+def _load_segments(json_path, mtime, fps):
+    """Parse and convert one segment file; keyed by mtime so a rewritten file is parsed again."""
+    data = read_json(json_path)
+    # Handle both list and dict formats
+    segs = data if isinstance(data, list) else data['segments']
+    sF, eF, sil = segment_arrays(segs, fps)
+    keep = eF > sF
+    arrays = sF[keep], eF[keep], sil[keep]
+    for a in arrays:
+        a.setflags(write=False)  # shared by every caller through the cache
+    return arrays
+
 def load_segments(json_path, fps):
-    """Load segments from JSON file with frame conversion."""
-    import json
-    segs = json.load(open(json_path))
-    out = []
-    for s in segs:
-        sF = int(s.get("startF", s.get("start_sec", 0)*fps))
-        eF = int(s.get("endF",   s.get("end_sec",   0)*fps))
-        if eF > sF: out.append((sF, eF, s.get("is_silence", False)))
-    return out
+    """Load segments from JSON file with frame conversion, as non-empty (startF, endF, is_silence) arrays."""
+    return _load_segments(json_path, os.path.getmtime(json_path), fps)
+
+def clamp_segments(sF, eF, length):
+    """Clamp segment frames to 0..length and drop the ones left empty."""
+    sF = np.maximum(np.minimum(sF, length - 1), 0)
+    eF = np.maximum(np.minimum(eF, length), 0)
+    return eF > sF, sF, eF
+
+def build_clip_infos(mpi, sF, eF, recF, sil, track_index, keep_silence=False):
+    """ClipInfos for one host's segment arrays; silence is dropped (left as a gap) unless kept."""
+    if not keep_silence:
+        speech = ~sil
+        sF, eF, recF, sil = sF[speech], eF[speech], recF[speech], sil[speech]
+    # map() over repeat() builds the tuples without per-segment bytecode or closure lookups
+    repeat = itertools.repeat
+    return list(map(ClipInfo, repeat(mpi), sF.tolist(), eF.tolist(), recF.tolist(),
+                    repeat(track_index), repeat(2), sil.tolist()))  # mediaType 2 = audio
+
+def fade_frames(fps):
+    """Crossfade length in frames (at least one)."""
+    return max(1, int(CONFIG["crossfade_ms"] / 1000.0 * fps))
 
 def process_compound_clips(tl, mp, proj, fps, hosts):
     """Process clips from source tracks to new processed tracks, grouping by source track."""
     print(f">>> Processing clips for {len(hosts)} hosts...")
     
     # Group hosts by source track
-    hosts_by_track = {}
+    hosts_by_track = defaultdict(list)
     for host in hosts:
-        src_idx = host["track"]
-        if src_idx not in hosts_by_track:
-            hosts_by_track[src_idx] = []
-        hosts_by_track[src_idx].append(host)
+        hosts_by_track[host["track"]].append(host)
+    
+    # Parse every host's segment JSON concurrently before the sequential Resolve API work
+    def load_host_segments(host):
+        try:
+            segs = load_segments(host['json'], fps)
+        except FileNotFoundError:
+            segs = None  # analysis failed or was skipped; no separate exists() probe needed
+        return host['name'], (host['json'], segs)
+    with ThreadPoolExecutor(max_workers=max(1, min(8, len(hosts)))) as ex:
+        segs_by_host = dict(ex.map(load_host_segments, hosts))
     
     # Get current track count and ensure we have enough destination tracks
     current_track_count = tl.GetTrackCount("audio")
     needed_tracks = current_track_count + len(hosts_by_track)
-    while tl.GetTrackCount("audio") < needed_tracks:
+    # Add the tracks back to back, then confirm them with a single count query
+    for _ in hosts_by_track:
         tl.AddTrack("audio")
+    track_count = tl.GetTrackCount("audio")
+    for idx in range(current_track_count + 1, track_count + 1):
+        invalidate_items(idx)
+    if track_count < needed_tracks:
+        print(f">>> WARNING: Only {track_count - current_track_count}/{len(hosts_by_track)} processed tracks could be added")
     
     # Track speaker clips for compound creation
     speaker_clips = {}  # Dictionary to store clips for each speaker
+    fade_f = fade_frames(fps)
+    keep_silence = CONFIG.get("keep_silence_clips", False)
     
     # Process each source track
     for i, (src_idx, track_hosts) in enumerate(hosts_by_track.items()):
@@ -258,102 +669,63 @@ def process_compound_clips(tl, mp, proj, fps, hosts):
         
         print(f">>> Processing {len(track_hosts)} hosts to track {dst_idx}")
         
-        # Ensure destination track is accessible
-        
-        # Get all clips from source track
-        items = tl.GetItemListInTrack("audio", src_idx) or []
-        if not items: 
-            print(f">>> Track {src_idx} empty, skipping")
-            continue
-        
-        print(f">>> Found {len(items)} clips on track {src_idx}")
+        # Hosts carry the timeline item found by discover_hosts, so the source track is not re-listed or searched by name
         
         # Process each host individually
         for host_idx, host in enumerate(track_hosts):
-            # Load segments for this host
-            json_path = f"{OUTDIR}/{host['name']}.json"
-            if not os.path.exists(json_path):
-                print(f">>> No JSON file found for {host['name']}: {json_path}")
+            name = host['name']
+            # Segments for this host (parsed up front)
+            json_path, segs = segs_by_host[name]
+            if segs is None:
+                print(f">>> No JSON file found for {name}: {json_path}")
                 continue
                 
-            segs = load_segments(json_path, fps)
-            if not segs:
-                print(f">>> No segments found for {host['name']}")
+            if not len(segs[0]):
+                print(f">>> No segments found for {name}")
                 continue
             
             # Use the host's original item directly
             matching_item = host['item']
             if not matching_item:
-                print(f">>> WARNING: No original item for {host['name']}")
+                print(f">>> WARNING: No original item for {name}")
                 continue
             
-            mpi = matching_item.GetMediaPoolItem()
+            info = host_info(host)
+            mpi = info["mpi"]
             if not mpi:
-                print(f">>> ERROR: No Media Pool Item for {host['name']}")
+                print(f">>> ERROR: No Media Pool Item for {name}")
                 continue
             
-            host_clip_infos = []
-            
             # Get timeline clip start time and duration
-            timeline_start = int(matching_item.GetStart())
-            timeline_end = int(matching_item.GetEnd())
+            timeline_start = info["start"]
+            timeline_end = info["end"]
             timeline_duration = timeline_end - timeline_start
             
-            for sF, eF, isSil in segs:
-                # Clamp segments to timeline clip duration
-                sF = max(0, min(sF, timeline_duration-1))
-                eF = max(0, min(eF, timeline_duration))
-                if eF <= sF: continue
-                
-                record_frame = timeline_start + sF
-                
-                clip_info = {
-                    "mediaPoolItem": mpi,
-                    "startFrame": sF,
-                    "endFrame": eF,
-                    "recordFrame": record_frame,
-                    "trackIndex": dst_idx,
-                    "mediaType": 2,
-                    "trackType": "audio",
-                    "is_silence": isSil,
-                    "host_name": host['name']
-                }
-                host_clip_infos.append(clip_info)
+            # Clamp segments to timeline clip duration
+            sF, eF, sil = segs
+            keep, sF, eF = clamp_segments(sF, eF, timeline_duration)
+            sF, eF, sil = sF[keep], eF[keep], sil[keep]
+            # Record frames are absolute, so skipping silence leaves a gap in place
+            host_clip_infos = build_clip_infos(mpi, sF, eF, timeline_start + sF, sil, dst_idx, keep_silence)
             
             # Process this host's segments immediately
             if not host_clip_infos:
-                print(f">>> No valid segments found for {host['name']}")
+                print(f">>> No valid segments found for {name}")
                 continue
             
             # Append this host's segments
             added = append_in_chunks(host_clip_infos, mp)
             
             if not added:
-                print(f">>> WARNING: No items were appended for {host['name']}")
+                print(f">>> WARNING: No items were appended for {name}")
                 continue
             
             # Store the clips for this speaker
-            speaker_clips[host['name']] = added
+            speaker_clips[name] = added
             
             # Add fades and disable silence segments
-            fade_f = max(1, int(0.02*fps))
-            disabled_count = 0
-            for j, (clip, clip_info) in enumerate(zip(added, host_clip_infos)):
-                try:
-                    clip.SetProperty("AudioFadeIn",  fade_f)
-                    clip.SetProperty("AudioFadeOut", fade_f)
-                    if clip_info.get("is_silence", False): 
-                        try: 
-                            clip.SetClipEnabled(False)
-                            disabled_count += 1
-                        except: 
-                            try:
-                                clip.SetProperty("Enabled", False)
-                                disabled_count += 1
-                            except:
-                                pass
-                except:
-                    pass
+            disabled_count = apply_fades(added, host_clip_infos, fade_f)
+            print(f">>> {name}: {len(added)} clips ({disabled_count} silence segments disabled)")
         
         # Set track name
         track_name = f"[Processed] {track_hosts[0]['name']}"
@@ -389,47 +761,51 @@ def process_compound_clips(tl, mp, proj, fps, hosts):
         print(f">>> No compound clips were created")
         
 
+# CreateCompoundClip call shapes, in the order first tried; the one that works is remembered
+COMPOUND_MODES = ("plain", "named", "selection")
+_compound_mode = None
+
+def _create_compound(tl, items, compound_name, mode):
+    """Call CreateCompoundClip using one of COMPOUND_MODES."""
+    if mode == "named":
+        return tl.CreateCompoundClip(items, {"clipName": compound_name})
+    if mode == "selection":
+        tl.SetSelection([])
+        tl.SetSelection(items)
+    return tl.CreateCompoundClip(items)
+
 def create_compound_clip_from_items(tl, mp, items, compound_name):
     """Create a compound clip from a specific list of timeline items."""
+    global _compound_mode
     if not items:
         print(f">>> ERROR: No items provided for compound clip '{compound_name}'")
         return None
     
-    # Create compound clip from the specific items
+    # Create compound clip from the specific items, starting with the call shape that worked last time
+    modes = COMPOUND_MODES
+    if _compound_mode:
+        modes = (_compound_mode,) + tuple(m for m in COMPOUND_MODES if m != _compound_mode)
     try:
-        # Try with just the items list (simplest approach)
-        compound_clip = tl.CreateCompoundClip(items)
-        
-        if compound_clip:
-            return compound_clip
-        
-        # Try with clipName parameter
-        compound_clip_info = {"clipName": compound_name}
-        compound_clip = tl.CreateCompoundClip(items, compound_clip_info)
-        
-        if compound_clip:
-            return compound_clip
-            
-        # Try with selection-based approach
-        tl.SetSelection([])
-        tl.SetSelection(items)
-        compound_clip = tl.CreateCompoundClip(items)
-        
-        if compound_clip:
-            return compound_clip
-            
+        for mode in modes:
+            compound_clip = _create_compound(tl, items, compound_name, mode)
+            if compound_clip:
+                _compound_mode = mode
+                return compound_clip
         return None
             
     except Exception as e:
         print(f">>> ERROR: Exception creating compound clip '{compound_name}': {e}")
         return None
+    finally:
+        # Compounding replaces the source items on their tracks
+        invalidate_items()
 
 def create_compound_clip_from_track(tl, mp, track_index, compound_name, resolve_obj):
     """Create a compound clip from all items in a track."""
     print(f">>> Creating compound clip '{compound_name}' from track {track_index}")
     
     # Get all items from the track
-    track_items = tl.GetItemListInTrack("audio", track_index) or []
+    track_items = get_items(tl, track_index)
     if not track_items:
         print(f">>> ERROR: No items found in track {track_index}")
         return None
@@ -439,18 +815,15 @@ def create_compound_clip_from_track(tl, mp, track_index, compound_name, resolve_
 def process_host(tl, mp, host, fps, assigned_track_index, resolve_obj, gap_frames=0):
     """Process a single host with butt-joined speech segments only"""
     
-    # Load silence detection results
-    json_path = os.path.join(OUTDIR, f"{host['name']}.json")
-    
-    with open(json_path, 'r') as f:
-        data = json.load(f)
-    
-    # Handle both list and dict formats
-    if isinstance(data, list):
-        segs = data
-    else:
-        segs = data['segments']
-    print(f">>> {host['name']}: {len(segs)} segments, FPS: {fps}")
+    # Load silence detection results (shared with process_compound_clips through the parse cache)
+    try:
+        sF, eF, sil = load_segments(host['json'], fps)
+    except FileNotFoundError:
+        # Analysis failed or was skipped for this host; the stat inside load_segments is the only check
+        print(f">>> ERROR: No silence analysis for {host['name']}")
+        return
+    print(f">>> {host['name']}: {len(sF)} segments, FPS: {fps}")
+    fade_f = fade_frames(fps)
     
     # Use the original item from discover_hosts
     original_item = host["item"]
@@ -460,67 +833,44 @@ def process_host(tl, mp, host, fps, assigned_track_index, resolve_obj, gap_frame
     
     # Use the compound clip's Media Pool Item directly
     # The API limitation means only the first host will work, but let's try anyway
-    mpi = original_item.GetMediaPoolItem()
+    info = host_info(host)
+    mpi = info["mpi"]
     if not mpi:
         print(f">>> ERROR: Could not get media pool item for {host['name']}")
         return
     
-    print(f">>> Using compound clip's Media Pool Item for {host['name']}")
-    print(f">>> Compound clip duration: {original_item.GetEnd() - original_item.GetStart()} frames")
+    if DEBUG:
+        print(f">>> Using compound clip's Media Pool Item for {host['name']}")
+        print(f">>> Compound clip duration: {info['end'] - info['start']} frames")
     
     # Duration clamping
-    dur_frames = None
-    try:
-        frames_str = (mpi.GetClipProperty("Frames") or "").strip()
-        if frames_str:
-            dur_frames = int(float(frames_str))
-    except:
-        pass
+    dur_frames = mpi_frames(mpi)
 
-    # Build all segments to maintain sync
-    def clamp(v, lo, hi): 
-        return max(lo, min(v, hi))
+    # Build all segments to maintain sync: clamp, drop empty, butt-join in array form
+    if dur_frames is not None:
+        keep, sF, eF = clamp_segments(sF, eF, dur_frames)
+        sF, eF, sil = sF[keep], eF[keep], sil[keep]
     
-    orig_start_recF = original_item.GetStart()   # anchor processed track to match timeline start
-    recF = orig_start_recF + gap_frames  # add gap between hosts
-
-    all_clip_infos = []
+    orig_start_recF = info["start"]   # anchor processed track to match timeline start
+    durations = eF - sF
+    # each segment is placed immediately after the previous one, offset by the gap between hosts
+    recF = orig_start_recF + gap_frames + np.cumsum(durations) - durations
     
-    for i, seg in enumerate(segs):
-        if "startF" in seg and "endF" in seg:
-            sF, eF = int(seg["startF"]), int(seg["endF"])
-        else:
-            sF = int(seg.get("start_sec", 0) * fps)
-            eF = int(seg.get("end_sec", 0) * fps)
-        if dur_frames is not None:
-            sF = clamp(sF, 0, dur_frames - 1)
-            eF = clamp(eF, 0, dur_frames)
-        if eF <= sF:
-            continue
-
-        clip_info = {
-            "mediaPoolItem": mpi,
-            "startFrame": sF,
-            "endFrame": eF,
-            "mediaType": 2,               # audio
-            "recordFrame": recF,          # place immediately after previous segment
-            "trackIndex": assigned_track_index,
-            "is_silence": seg.get("is_silence", False)  # Store silence flag for later
-        }
-        all_clip_infos.append(clip_info)
-        recF += (eF - sF)
+    silence_count = int(sil.sum())
+    keep_silence = CONFIG.get("keep_silence_clips", False)
+    # Silence becomes a gap: its record range is simply never filled
+    all_clip_infos = build_clip_infos(mpi, sF, eF, recF, sil, assigned_track_index, keep_silence)
 
     if not all_clip_infos:
         print(f">>> No segments for {host['name']}")
         return
 
-    speech_count = len([c for c in all_clip_infos if not c.get("is_silence", False)])
-    silence_count = len([c for c in all_clip_infos if c.get("is_silence", False)])
-    print(f">>> Adding {len(all_clip_infos)} total clips ({speech_count} speech, {silence_count} silence) to track {assigned_track_index}...")
+    speech_count = len(all_clip_infos) - (silence_count if keep_silence else 0)
+    silence_note = "silence" if keep_silence else "silence left as gaps"
+    print(f">>> Adding {len(all_clip_infos)} total clips ({speech_count} speech, {silence_count} {silence_note}) to track {assigned_track_index}...")
     
     # Ensure we're on Edit page and track is unlocked
-    resolve_obj.OpenPage("edit")
-    time.sleep(0.1)
+    ensure_edit_page(resolve_obj)
 
     # Ensure track is accessible
 
@@ -530,51 +880,27 @@ def process_host(tl, mp, host, fps, assigned_track_index, resolve_obj, gap_frame
     print(f">>> {host['name']}: appended {len(items)} total clips to track {assigned_track_index}")
 
     # Disable silence segments and add crossfades
-    disabled_count = 0
-    fade_s = CONFIG["crossfade_ms"] / 1000.0  # Convert ms to seconds
-    fade_f = max(1, int(fade_s * fps))
-    
-    for i, item in enumerate(items):
-        try:
-            # Add crossfades to all clips
-            item.SetProperty("AudioFadeIn", fade_f)
-            item.SetProperty("AudioFadeOut", fade_f)
-            
-            # Disable silence segments
-            if i < len(all_clip_infos) and all_clip_infos[i].get("is_silence", False):
-                try:
-                    item.SetClipEnabled(False)
-                    disabled_count += 1
-                except:
-                    # Alternative method
-                    try:
-                        item.SetProperty("Enabled", False)
-                        disabled_count += 1
-                    except:
-                        pass
-        except: 
-            pass
+    disabled_count = apply_fades(items, all_clip_infos, fade_f)
 
     print(f">>> Created [Processed] {host['name']} with {len(items)} clips ({disabled_count} silence segments disabled)")
     
-    # Final track count
-    track_items = tl.GetItemListInTrack("audio", assigned_track_index) or []
-    print(f">>> Track {assigned_track_index} now has {len(track_items)} items")
+    # Track scans cost a full item listing; only do them when debugging
+    if DEBUG:
+        track_items = get_items(tl, assigned_track_index)
+        print(f">>> Track {assigned_track_index} now has {len(track_items)} items")
     
     # Create compound clip from the processed track
     print(f">>> Attempting to create compound clip for {host['name']}...")
     compound_name = f"{host['name']}_Gated"
     
-    # Add a small delay to ensure all clips are properly placed
-    time.sleep(0.5)
-    
-    # Verify items are still on the track before creating compound clip
-    final_track_items = tl.GetItemListInTrack("audio", assigned_track_index) or []
-    print(f">>> Final verification: Track {assigned_track_index} has {len(final_track_items)} items before compound creation")
-    
-    if final_track_items:
-        # Create compound clip from just this speaker's clips (the items we just added)
-        compound_clip = create_compound_clip_from_items(tl, mp, items, compound_name)
+    if items:
+        # Create compound clip from just this speaker's clips (the items we just added);
+        # AppendToTimeline is synchronous, so only wait if Resolve is still settling
+        for delay in COMPOUND_RETRY_DELAYS:
+            time.sleep(delay)
+            compound_clip = create_compound_clip_from_items(tl, mp, items, compound_name)
+            if compound_clip:
+                break
         
         if compound_clip:
             print(f">>> Successfully created compound clip '{compound_name}' for {host['name']}")
@@ -582,41 +908,135 @@ def process_host(tl, mp, host, fps, assigned_track_index, resolve_obj, gap_frame
             print(f">>> WARNING: Could not create compound clip for {host['name']}")
             print(f">>> You may need to manually select the {len(items)} clips for {host['name']} and create a compound clip")
     else:
-        print(f">>> ERROR: No items found on track {assigned_track_index} for compound clip creation")
+        print(f">>> ERROR: No items were appended to track {assigned_track_index} for compound clip creation")
         compound_clip = None
     
     return compound_clip
 
-def main():
-    """Main function."""
-    if not resolve:
-        print("ERROR: Could not connect to DaVinci Resolve")
-        return
-    
-    # Get project and timeline
-    proj = resolve.GetProjectManager().GetCurrentProject()
-    if not proj:
-        print("ERROR: No project loaded")
-        return
-    
-    tl = proj.GetCurrentTimeline()
-    if not tl:
-        print("ERROR: No timeline loaded")
-        return
+def source_range(host, fps):
+    """Return (path, start_sec, end_sec) of a host's file-backed source media, or None if it has none."""
+    item = host["item"]
+    try:
+        info = host_info(host)
+        mpi = info["mpi"]
+        path = (mpi.GetClipProperty("File Path") or "").strip() if mpi else ""
+        if not path or not os.path.isfile(path):
+            return None
+        start_sec = item.GetLeftOffset() / fps
+        return path, start_sec, start_sec + (info["end"] - info["start"]) / fps
+    except Exception:
+        return None
+
+def wav_names(host):
+    """Filenames the render preset can give a host's clip, most specific first."""
+    return [f"{base}{suffix}.wav" for base in (host['clip'], host['name']) for suffix in ("", "00000000", "_00000000")]
+
+# What Resolve may append to a clip name when it numbers a render: separators and digits, never letters
+_RENDER_SUFFIX = re.compile(r"[_ -]*\d*\.wav")
+
+def find_host_wav(host, wav_index, claimed=()):
+    """Path of host's rendered WAV in wav_index (filename -> path), or None.
     
-    # Discover hosts
+    claimed: filenames that are some host's exact render name; the prefix fallback never takes them.
+    """
+    wav_file = next((wav_index[p] for p in wav_names(host) if p in wav_index), None)
+    if not wav_file:
+        # Other render suffixes: accept a prefix match, but only when it is unambiguous
+        # and the rest of the name is a numbering suffix (so "Ann" never picks up "Anna.wav")
+        clip = host['clip']
+        prefixed = [path for fname, path in wav_index.items()
+                    if fname.startswith(clip) and fname not in claimed and _RENDER_SUFFIX.fullmatch(fname, len(clip))]
+        if len(prefixed) == 1:
+            wav_file = prefixed[0]
+    return wav_file
+
+# Analysis of file-backed sources is kept between runs; FORCE_REANALYZE (or --force) re-analyzes everything
+SEGMENT_CACHE = os.path.expanduser("~/.cache/davincigate/segments")
+# Resolve's Scripts menu passes no arguments (and embedded interpreters may have no sys.argv), so config is the usual switch
+FORCE = CONFIG.get("force_reanalyze", False) or "--force" in getattr(sys, "argv", [])
+
+def segment_cache_path(src_path, kwargs):
+    """Cache file for one source file analyzed with one set of detection settings."""
+    # pcm_cache only decides whether the decode is kept, not what the analysis produces
+    settings = sorted((k, v) for k, v in kwargs.items() if k != "pcm_cache")
+    key = json.dumps([os.path.abspath(src_path), settings])
+    return os.path.join(SEGMENT_CACHE, hashlib.sha1(key.encode()).hexdigest() + ".json")
+
+def analysis_workers():
+    """Process count for silence analysis: the CPUs this process may run on, capped by CONFIG max_workers."""
     try:
-        hosts = discover_hosts(tl)
-    except RuntimeError as e:
-        print(f"ERROR: {e}")
+        # cpu_count() reports the whole machine even when a container or affinity mask allows fewer
+        n = len(os.sched_getaffinity(0))
+    except AttributeError:
+        n = os.cpu_count() or 1  # macOS and Windows have no affinity query
+    cap = CONFIG.get("max_workers")
+    return max(1, min(n, cap) if cap else n)
+
+def json_fresh(json_path, src_path, max_age=None, mtime=None):
+    """True if json_path is newer than src_path and no older than max_age seconds (mtime: prefetched json mtime)."""
+    try:
+        if mtime is None:
+            mtime = os.path.getmtime(json_path)
+        src_mtime = os.path.getmtime(src_path)
+    except OSError:
+        return False
+    max_age = CONFIG.get("max_json_age", 86400) if max_age is None else max_age
+    return mtime >= src_mtime and time.time() - mtime <= max_age
+
+def segment_cache_mtimes():
+    """mtime of every cached segment file, from one directory scan."""
+    try:
+        with os.scandir(SEGMENT_CACHE) as entries:
+            return {e.name: e.stat().st_mtime for e in entries}
+    except OSError:
+        return {}
+
+def store_segments(json_path, cache_path):
+    """Keep a copy of a fresh analysis for the next run; failing only costs a re-analysis."""
+    if not cache_path:
         return
+    try:
+        os.makedirs(SEGMENT_CACHE, exist_ok=True)
+        shutil.copyfile(json_path, cache_path)
+    except OSError:
+        pass
+
+RENDER_POLL_MAX = 2.0  # seconds between render-progress polls during long renders
+
+def wait_for_render(proj, job_id):
+    """Block until rendering stops; returns False if Resolve reports the job failed or was cancelled."""
+    # Poll quickly at first and back off, so short renders are noticed at once and long ones cost few calls
+    delay = 0.05
+    started = time.monotonic()
+    while proj.IsRenderingInProgress():
+        time.sleep(delay)
+        delay = min(delay * 1.5, RENDER_POLL_MAX)
+        if delay > 0.25:
+            # Long render: never wait more than half the estimated time left, so the finish is still caught quickly
+            try:
+                pct = float((proj.GetRenderJobStatus(job_id) or {}).get("CompletionPercentage", 0))
+            except:
+                pct = 0
+            if 0 < pct < 100:
+                remaining = (time.monotonic() - started) * (100 - pct) / pct
+                delay = max(0.05, min(delay, remaining / 2))
     
-    # Render audio files
+    try:
+        status = (proj.GetRenderJobStatus(job_id) or {}).get("JobStatus", "")
+    except:
+        return True  # no status API: assume it finished, the WAV lookup reports anything missing
+    if status in ("Failed", "Cancelled"):
+        print(f">>> ERROR: Render job {status.lower()}")
+        return False
+    return True
+
+def render_hosts(resolve_obj):
+    """Render every timeline clip to its own WAV in OUTDIR; returns the project, or None on failure."""
+    global _edit_page_ready
     print(">>> Switching to Deliver page")
-    resolve.OpenPage("deliver")
-    proj = resolve.GetProjectManager().GetCurrentProject()
-    tl = proj.GetCurrentTimeline()
-    mp = proj.GetMediaPool()
+    resolve_obj.OpenPage("deliver")
+    _edit_page_ready = False
+    proj = resolve_obj.GetProjectManager().GetCurrentProject()
     
     # Load render preset
     render_preset = CONFIG["render_preset"]
@@ -640,21 +1060,81 @@ def main():
         proj.SetRenderSettings({"TargetDir": OUTDIR})
     except Exception as e:
         print(f">>> ERROR: Could not set target directory")
-        return
+        return None
+    try:
+        # Audio only even when the preset failed to load and the current one includes video
+        proj.SetRenderSettings({"ExportVideo": False, "ExportAudio": True})
+    except:
+        pass
     
     # Add render job and start rendering
     job_id = proj.AddRenderJob()
     if not job_id:
         print("ERROR: Could not create render job")
-        return
+        return None
     
     proj.StartRendering()
+    ok = wait_for_render(proj, job_id)
+    proj.DeleteRenderJob(job_id)
+    return proj if ok else None
+
+def main():
+    """Main function."""
+    _frames_cache.clear()
+    _host_cache.clear()
+    invalidate_items()
+    # Read once; both lookups below consult it and add to it
+    path_cache = load_path_cache()
+    if not find_detect_silence(path_cache):
+        return
+    make_outdir()
+    try:
+        resolve = get_resolve(path_cache)
+    except Exception as e:
+        print(f"ERROR: DaVinci Resolve API not available: {e}")
+        return
+    if not resolve:
+        print("ERROR: Could not connect to DaVinci Resolve")
+        return
     
-    # Wait for render to complete
-    while proj.IsRenderingInProgress():
-        time.sleep(1)
+    # Get project and timeline
+    proj = resolve.GetProjectManager().GetCurrentProject()
+    if not proj:
+        print("ERROR: No project loaded")
+        return
     
-    proj.DeleteRenderJob(job_id)
+    tl = proj.GetCurrentTimeline()
+    if not tl:
+        print("ERROR: No timeline loaded")
+        return
+    
+    # Discover hosts
+    try:
+        hosts = discover_hosts(tl)
+    except RuntimeError as e:
+        print(f"ERROR: {e}")
+        return
+    snapshot_hosts(hosts)
+    audio_track_count = tl.GetTrackCount("audio")
+    
+    # Read file-backed sources directly when allowed. The render job cannot be limited to particular
+    # clips, so if any host still needs rendering the whole timeline is rendered; covered hosts keep
+    # their source analysis and ignore their render
+    sources = {}
+    if CONFIG.get("skip_render", False):
+        fps = float(proj.GetSetting("timelineFrameRate") or "29.97")
+        # Each lookup is a few blocking bridge calls; overlap them as snapshot_hosts does
+        with ThreadPoolExecutor(max_workers=max(1, min(FADE_WORKERS, len(hosts)))) as ex:
+            for host, src in zip(hosts, ex.map(source_range, hosts, itertools.repeat(fps))):
+                if src:
+                    sources[host['name']] = src
+        print(f">>> Reading {len(sources)}/{len(hosts)} hosts directly from source media")
+    
+    rendered = len(sources) < len(hosts)
+    if rendered:
+        proj = render_hosts(resolve)
+        if not proj:
+            return
     
     # Get media pool
     mp = proj.GetMediaPool()
@@ -662,61 +1142,140 @@ def main():
         print("ERROR: No media pool available")
         return
     
-    # Process silence detection
-    all_wav_files = glob.glob(os.path.join(OUTDIR, "*.wav"))
+    # Index the rendered WAVs once instead of probing each candidate name
+    wav_index = {entry.name: entry.path for entry in os.scandir(OUTDIR) if entry.name.endswith(".wav")}
+    
+    # A lone multichannel render (one channel per audio track) can be demuxed per host, but only when
+    # it is nobody's own render and its layout matches the timeline; otherwise a speaker would be
+    # gated on another speaker's audio
+    # Exact render names of every host, so one host's prefix fallback cannot take another's file
+    claimed = {fname for host in hosts for fname in wav_names(host) if fname in wav_index}
+    stem = None
+    if len(wav_index) == 1 and not any(find_host_wav(host, wav_index, claimed) for host in hosts):
+        path = next(iter(wav_index.values()))
+        try:
+            # Multichannel renders are usually WAVE_FORMAT_EXTENSIBLE, which the wave module rejects before 3.12
+            from detect_silence import wav_info
+            with open(path, "rb") as f:
+                stem_channels = wav_info(f)[0]
+        except (wave.Error, EOFError, OSError, ImportError):
+            stem_channels = 0
+        if stem_channels > 1 and stem_channels == audio_track_count:
+            stem = path
+        else:
+            print(f">>> WARNING: {os.path.basename(path)} matches no host and has {stem_channels} channels "
+                  f"for {audio_track_count} audio tracks; not splitting it per track")
     
     # Collect individual WAV files for each host
     per_host_wavs = []
     for host in hosts:
-        wav_file = None
-        patterns_to_try = [
-            f"{host['clip']}.wav",
-            f"{host['clip']}00000000.wav",
-            f"{host['clip']}_00000000.wav",
-            f"{host['name']}.wav",
-            f"{host['name']}00000000.wav",
-            f"{host['name']}_00000000.wav"
-        ]
-        
-        for pattern in patterns_to_try:
-            candidate = os.path.join(OUTDIR, pattern)
-            if os.path.exists(candidate):
-                wav_file = candidate
-                break
+        name = host['name']
+        if name in sources:
+            path, start_sec, end_sec = sources[name]
+            per_host_wavs.append((host, path, {"start_sec": start_sec, "end_sec": end_sec}))
+            continue
         
+        wav_file = find_host_wav(host, wav_index, claimed)
         if wav_file:
-            per_host_wavs.append((host, wav_file))
+            per_host_wavs.append((host, wav_file, {}))
+        elif stem:
+            per_host_wavs.append((host, stem, {"channel": host['track'] - 1}))
     
-    # Run silence detection
+    # Run silence detection, one worker process per host
     if per_host_wavs:
-        successful = 0
-        for host, wav_file in per_host_wavs:
-            json_path = os.path.join(OUTDIR, f"{host['name']}.json")
-            
-            try:
-                print(f">>> Analyzing: {host['name']}")
-                result = detect_silence(
-                    wav_file, 
-                    min_sil_ms=CONFIG["min_silence_ms"],
-                    pad_ms=CONFIG["padding_ms"],
-                    out_json=json_path,
-                    silence_thresh_db=CONFIG["silence_threshold_db"],
-                    fps_hint=CONFIG["fps_hint"]
-                )
-                
-                if os.path.exists(json_path):
-                    successful += 1
-            except Exception as e:
-                print(f">>> ERROR: Silence detection failed for {host['name']}: {e}")
+        # Deferred: detect_silence and multiprocessing are only needed when there is audio to analyze
+        from concurrent.futures import ProcessPoolExecutor
+        from concurrent.futures.process import BrokenProcessPool
+        try:
+            from detect_silence import analyze_to_json
+        except ImportError as e:
+            print(f"ERROR: Could not import detect_silence.py: {e}")
+            return
+        
+        detect_kwargs = {
+            "min_sil_ms": CONFIG["min_silence_ms"],
+            "pad_ms": CONFIG["padding_ms"],
+            "silence_thresh_db": CONFIG["silence_threshold_db"],
+            "fps_hint": CONFIG["fps_hint"],
+            "backend": CONFIG.get("silence_backend", "numpy"),
+        }
+        if CONFIG.get("cache_decoded_audio", False):
+            detect_kwargs["pcm_cache"] = True
+        jobs = [(host['name'], wav_file, host['json'], dict(detect_kwargs, **extra))
+                for host, wav_file, extra in per_host_wavs]
+        
+        # Rendered WAVs are new every run, but source media results can be reused until the file changes
+        cache_paths = {name: segment_cache_path(wav_file, kwargs)
+                       for name, wav_file, _, kwargs in jobs if name in sources}
+        cached = 0
+        if not FORCE and cache_paths:
+            cache_mtimes = segment_cache_mtimes()
+            pending = []
+            for job in jobs:
+                name, wav_file, json_path, _ = job
+                # Names missing from the scan are misses without touching the source file
+                mtime = cache_mtimes.get(os.path.basename(cache_paths.get(name, "")))
+                if mtime is not None and json_fresh(cache_paths[name], wav_file, mtime=mtime):
+                    try:
+                        shutil.copyfile(cache_paths[name], json_path)
+                        cached += 1
+                        continue
+                    except OSError:
+                        pass
+                pending.append(job)
+            jobs = pending
+        
+        if cached:
+            print(f">>> Reusing cached silence analysis for {cached} hosts (set FORCE_REANALYZE = True in config.py to redo)")
+        
+        successful = cached
+        if jobs:
+            workers = min(len(jobs), analysis_workers())
+            # A single job (or a single core) gains nothing from a worker process but pays its spawn
+            serial = workers == 1
+            if not serial:
+                print(f">>> Analyzing {len(jobs)} hosts with {workers} worker processes")
+                try:
+                    with ProcessPoolExecutor(max_workers=workers) as pool:
+                        futures = [pool.submit(analyze_to_json, job) for job in jobs]
+                        for done, future in enumerate(as_completed(futures), 1):
+                            name, json_path, ok = future.result()
+                            if ok:
+                                successful += 1
+                                store_segments(json_path, cache_paths.get(name))
+                                print(f">>> Analyzed {name} ({done}/{len(jobs)})")
+                            else:
+                                print(f">>> ERROR: Silence detection failed for {name}")
+                except (BrokenProcessPool, OSError) as e:
+                    # Some embedded interpreters cannot spawn workers; fall back to in-process analysis
+                    print(f">>> WARNING: Process pool unavailable ({e}) - analyzing serially")
+                    successful = cached
+                    serial = True
+            if serial:
+                for job in jobs:
+                    name, json_path, ok = analyze_to_json(job)
+                    if ok:
+                        successful += 1
+                        store_segments(json_path, cache_paths.get(name))
+                    else:
+                        print(f">>> ERROR: Silence detection failed for {name}")
         
         print(f">>> Silence detection complete: {successful}/{len(per_host_wavs)} successful")
+        # Rendered WAVs are not needed past analysis; delete them while Resolve builds the timeline
+        if wav_index:
+            remove_files_async(list(wav_index.values()))
     else:
         print(f">>> ERROR: No WAV files found for processing")
         return
     
     # Switch to edit page and process audio
     print(">>> Switching to Edit page")
-    proj, tl, mp = refresh_handles(resolve)
+    if rendered:
+        # The Deliver page round trip can leave stale handles; fetch fresh ones
+        proj, tl, mp = refresh_handles(resolve)
+    else:
+        # Never left the Edit page, so the handles from the start of the run are still live
+        ensure_edit_page(resolve)
     
     # Get FPS from timeline settings
     fps = float(proj.GetSetting("timelineFrameRate") or "29.97")
@@ -727,9 +1286,13 @@ def main():
     if use_compound_processing:
         process_compound_clips(tl, mp, proj, fps, hosts)
     else:
-        # Individual processing approach (simplified)
+        # Individual processing approach: one new track and compound clip per host, same segment builder
         print(">>> Using individual track processing approach")
-        # ... individual processing code would go here if needed
+        for host in hosts:
+            tl.AddTrack("audio")
+            track_index = tl.GetTrackCount("audio")
+            invalidate_items(track_index)
+            process_host(tl, mp, host, fps, track_index, resolve)
     
     print(f">>> Processing complete. Created compound clips for each speaker.")
 
@@ -738,5 +1301,5 @@ if __name__ == "__main__":
         main()
     finally:
         # Clean up temp directory
-        if os.path.exists(OUTDIR):
-            shutil.rmtree(OUTDIR, ignore_errors=True)
\ No newline at end of file
+        if OUTDIR and os.path.exists(OUTDIR):
+            cleanup_outdir()
\ No newline at end of file
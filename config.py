@@ -16,11 +16,15 @@ SILENCE_THRESHOLD_DB = -50.0  # dB threshold for silence detection
 MIN_SILENCE_MS = 1000          # Minimum silence duration in milliseconds
 PADDING_MS = 400              # Padding around speech segments in milliseconds
 HOLD_MS = 100                 # Extra hold time at end of speech segments
+SILENCE_BACKEND = "numpy"     # "numpy" (windowed RMS) or "ffmpeg" (silencedetect filter, needs ffmpeg)
 
 # Processing settings
 CROSSFADE_MS = 20             # Crossfade duration in milliseconds
 BATCH_SIZE = 250              # Number of segments to process in each batch
 FPS_HINT = 30                 # FPS hint for frame-based calculations
+SKIP_RENDER = False           # Analyze file-backed source media directly instead of rendering
+KEEP_SILENCE_CLIPS = False    # Append silence as disabled clips instead of leaving gaps
+CACHE_DECODED_AUDIO = False   # Keep ffmpeg-decoded (non-WAV) source audio between runs for faster re-analysis
 
 # Path settings (leave as None for auto-detection)
 SCRIPT_DIR = None             # Path to script directory (auto-detected if None)
@@ -28,6 +32,8 @@ TEMP_DIR = None               # Path to temporary directory (auto-detected if No
 
 # Advanced settings
 MAX_JSON_AGE = 86400          # Maximum age of JSON files in seconds (24 hours)
+FORCE_REANALYZE = False       # Ignore cached silence analysis and re-analyze every host
+MAX_WORKERS = None            # Cap on silence-analysis processes (None = every CPU available to Resolve)
 MERGE_TOLERANCE_MS = 100      # Tolerance for merging nearby segments
 MIN_SIL_GAP_MS = 1            # Minimum silence gap to preserve (in frames)
 
@@ -1,30 +1,231 @@
-from pydub import AudioSegment
-from pydub.silence import detect_nonsilent
+import numpy as np
+import hashlib
+import re
+import wave
 import os, sys, json
+from functools import lru_cache
 
-def detect_silence(wav_path, min_sil_ms=600, pad_ms=120, out_json=None, silence_thresh_db=-50.0, fps_hint=30):
-    """Detect silence segments in audio file and return segments list."""
-    if not os.path.exists(wav_path):
-        print(f"detect_silence: ERROR - File does not exist: {wav_path}")
-        return []
+try:
+    import orjson  # optional, much faster JSON writing
+except ImportError:
+    orjson = None
+
+FFMPEG_RATE = 48000  # decode rate for non-WAV inputs
+PCM_CACHE = os.path.expanduser("~/.cache/davincigate/pcm")  # decoded non-WAV audio, when enabled
+
+# KSDATAFORMAT_SUBTYPE_PCM, minus its leading 2-byte format code (1 = integer PCM)
+_PCM_SUBFORMAT_TAIL = bytes.fromhex("000000001000800000aa00389b71")
+
+def wav_info(f):
+    """(channels, sample rate, sample width, data offset, data bytes) of an open RIFF/WAVE file.
     
+    Parses the fmt chunk itself so WAVE_FORMAT_EXTENSIBLE integer PCM is accepted (the wave module
+    rejects it before Python 3.12); any other encoding raises wave.Error.
+    """
+    f.seek(0)
+    riff = f.read(12)
+    if len(riff) < 12 or riff[:4] != b"RIFF" or riff[8:] != b"WAVE":
+        raise wave.Error("not a RIFF/WAVE file")
+    fmt = None
+    while True:
+        header = f.read(8)
+        if len(header) < 8:
+            raise wave.Error("no data chunk")
+        size = int.from_bytes(header[4:], "little")
+        if header[:4] == b"data":
+            break
+        if header[:4] == b"fmt ":
+            fmt = f.read(size)
+            f.seek(size & 1, 1)
+        else:
+            f.seek(size + (size & 1), 1)  # chunks are word aligned
+    if fmt is None or len(fmt) < 16:
+        raise wave.Error("missing or short fmt chunk")
+    tag = int.from_bytes(fmt[0:2], "little")
+    ch = int.from_bytes(fmt[2:4], "little")
+    sr = int.from_bytes(fmt[4:8], "little")
+    block_align = int.from_bytes(fmt[12:14], "little")
+    if tag == 0xFFFE:
+        if len(fmt) < 40 or fmt[24:26] != b"\x01\x00" or fmt[26:40] != _PCM_SUBFORMAT_TAIL:
+            raise wave.Error("WAVE_FORMAT_EXTENSIBLE file is not integer PCM")
+    elif tag != 1:
+        raise wave.Error(f"unsupported WAV format tag {tag:#x}")
+    # The container width; extensible files may hold e.g. 24 valid bits in 4 bytes
+    width = block_align // ch if ch else 0
+    if not sr or width not in (1, 2, 3, 4):
+        raise wave.Error(f"unsupported WAV layout ({ch} channels, {block_align} bytes per frame)")
+    return ch, sr, width, f.tell(), size
+
+def _read_wav(wav_path, start_sec=None, end_sec=None):
+    """Map a PCM WAV file (optionally just start_sec..end_sec) as an (n_frames, channels) array plus sample rate and width."""
+    with open(wav_path, "rb") as f:
+        ch, sr, width, data_offset, data_size = wav_info(f)
+        total = data_size // (ch * width)
+        first = min(int((start_sec or 0) * sr), total)
+        last = total if end_sec is None else min(int(end_sec * sr), total)
+        offset = data_offset + first * ch * width
+        # A render cut short can leave fewer bytes than the header claims; map only what exists
+        n = max(0, min(last - first, (os.fstat(f.fileno()).st_size - offset) // (ch * width)))
+    if not n:
+        return np.zeros((0, ch), dtype=np.int32), sr, width
+    # Memory-mapped, so pages are read as the energy pass reaches them instead of all up front
+    if width in (2, 4):
+        samples = np.memmap(wav_path, dtype={2: "<i2", 4: "<i4"}[width], mode="r", offset=offset, shape=(n, ch))
+        return samples, sr, width
+    raw = np.memmap(wav_path, dtype=np.uint8, mode="r", offset=offset, shape=(n * ch * width,))
+    if width == 3:
+        # 24-bit PCM (our render preset): sign-extend each little-endian triplet to int32,
+        # building in place from the signed high byte down (one int32 buffer, no temporaries)
+        b = raw.reshape(-1, 3)
+        samples = b[:, 2].view(np.int8).astype(np.int32)
+        samples <<= 8
+        samples |= b[:, 1]
+        samples <<= 8
+        samples |= b[:, 0]
+    else:
+        samples = raw.astype(np.int16) - 128
+    return samples.reshape(-1, ch), sr, width
+
+@lru_cache(maxsize=None)
+def which(name):
+    """True if an executable is on PATH; memoized so the PATH scan runs once per name."""
+    import shutil
+    return shutil.which(name) is not None
+
+# Single-stream audio containers describe themselves in their header, so ffmpeg's default
+# multi-megabyte / 5 s stream probe is wasted start-up on every decode
+_AUDIO_EXTS = {".wav", ".wave", ".aif", ".aiff", ".flac", ".mp3", ".m4a", ".aac", ".ogg", ".opus"}
+
+def _ffmpeg_input(path, start_sec=None, end_sec=None):
+    """ffmpeg input arguments for path, trimmed to start_sec..end_sec."""
+    args = []
+    if os.path.splitext(path)[1].lower() in _AUDIO_EXTS:
+        args += ["-probesize", "32k", "-analyzeduration", "0"]
+    if start_sec:
+        args += ["-ss", str(start_sec)]
+    args += ["-i", path]
+    if end_sec is not None:
+        args += ["-t", str(end_sec - (start_sec or 0))]
+    return args
+
+def _read_ffmpeg(path, start_sec=None, end_sec=None, channel=None):
+    """Decode any ffmpeg-readable file (or one of its channels) to mono 16-bit PCM via a pipe (no temp file)."""
+    if not which("ffmpeg"):
+        raise RuntimeError("ffmpeg not found on PATH (needed to decode non-WAV audio)")
+    import subprocess  # only the non-WAV fallback needs it; keeps worker start-up light
+    cmd = ["ffmpeg", "-v", "quiet"] + _ffmpeg_input(path, start_sec, end_sec)
+    cmd += ["-vn"] + (["-af", f"pan=mono|c0=c{channel}"] if channel is not None else ["-ac", "1"])
+    cmd += ["-f", "s16le", "-ar", str(FFMPEG_RATE), "pipe:1"]
+    p = subprocess.run(cmd, stdout=subprocess.PIPE, check=True)
+    return np.frombuffer(p.stdout, dtype=np.int16).reshape(-1, 1), FFMPEG_RATE, 2
+
+def _read_ffmpeg_cached(path, start_sec=None, end_sec=None, channel=None):
+    """_read_ffmpeg through an mtime-checked .npy cache, so re-analysis with new settings skips the decode."""
+    key = json.dumps([os.path.abspath(path), start_sec, end_sec, channel, FFMPEG_RATE])
+    npy = os.path.join(PCM_CACHE, hashlib.sha1(key.encode()).hexdigest() + ".npy")
     try:
-        a = AudioSegment.from_file(wav_path)
-    except Exception as e:
-        print(f"detect_silence: ERROR loading audio file: {e}")
-        return []
+        if os.path.getmtime(npy) >= os.path.getmtime(path):
+            return np.load(npy, mmap_mode="r"), FFMPEG_RATE, 2
+    except (OSError, ValueError):
+        pass
+    samples, sr, width = _read_ffmpeg(path, start_sec, end_sec, channel)
+    try:
+        os.makedirs(PCM_CACHE, exist_ok=True)
+        # Write then rename, so a concurrent worker never maps a half-written file
+        tmp = f"{npy}.{os.getpid()}.tmp"
+        with open(tmp, "wb") as f:
+            np.save(f, samples)
+        os.replace(tmp, npy)
+    except OSError:
+        pass
+    return samples, sr, width
+
+_SILENCE_RE = re.compile(r"silence_(?:start|end):\s*(-?[\d.]+)")
+_TIME_RE = re.compile(r"time=\s*(\d+):(\d+):([\d.]+)")
+
+def _detect_nonsilent_ffmpeg(path, min_silence_len, silence_thresh, start_sec=None, end_sec=None, channel=None):
+    """Speech ranges from ffmpeg's silencedetect filter; returns ([start_ms, end_ms] pairs, total_ms)."""
+    if not which("ffmpeg"):
+        raise RuntimeError("ffmpeg not found on PATH (needed for the ffmpeg silence backend)")
+    import subprocess
+    cmd = ["ffmpeg", "-hide_banner", "-stats"] + _ffmpeg_input(path, start_sec, end_sec)
+    af = f"silencedetect=noise={silence_thresh}dB:d={min_silence_len / 1000.0}"
+    if channel is not None:
+        af = f"pan=mono|c0=c{channel},{af}"
+    # Audio only, and a null encode in the decoder's own 32-bit format so no sample conversion runs
+    cmd += ["-vn", "-af", af, "-c:a", "pcm_s32le", "-f", "null", "-"]
+    p = subprocess.run(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, check=True)
+    log = p.stderr.decode("utf-8", "replace")
     
-    # Settings matching Resolve: -50dB threshold, 150ms min silence
-    speech = detect_nonsilent(a, min_silence_len=min_sil_ms, silence_thresh=silence_thresh_db, seek_step=20)
+    # The last progress line holds the decoded length
+    times = _TIME_RE.findall(log)
+    if not times:
+        raise RuntimeError("ffmpeg reported no decoded duration")
+    h, m, sec = times[-1]
+    total_ms = int((int(h) * 3600 + int(m) * 60 + float(sec)) * 1000)
     
+    # 0, silence_start, silence_end, ... alternates speech/silence; trailing silence may have no end
+    bounds = [0] + [min(total_ms, max(0, int(round(float(t) * 1000)))) for t in _SILENCE_RE.findall(log)]
+    if len(bounds) % 2:
+        bounds.append(total_ms)
+    return [[s, e] for s, e in zip(bounds[::2], bounds[1::2]) if e > s], total_ms
+
+def _ms_energy(samples, sr):
+    """Sum of squared samples (all channels) for every whole millisecond of audio."""
+    n_ms = len(samples) * 1000 // sr
+    energy = np.empty(n_ms)
+    step = 60000  # one minute at a time keeps the float64 scratch buffer small
+    for m0 in range(0, n_ms, step):
+        m1 = min(m0 + step, n_ms)
+        f0, f1 = m0 * sr // 1000, m1 * sr // 1000
+        chunk = samples[f0:f1].astype(np.float64)
+        frame_energy = np.einsum("ij,ij->i", chunk, chunk)
+        energy[m0:m1] = np.add.reduceat(frame_energy, np.arange(m0, m1) * sr // 1000 - f0)
+    return energy
+
+def _detect_nonsilent(samples, sr, width, min_silence_len, silence_thresh, seek_step=1):
+    """Vectorized equivalent of pydub.silence.detect_nonsilent; returns [start_ms, end_ms] pairs."""
+    n_ms = len(samples) * 1000 // sr
+    if n_ms < min_silence_len:
+        return [[0, n_ms]] if n_ms else []
+
+    # Windowed RMS for every seek position from one cumulative sum
+    csum = np.concatenate(([0.0], np.cumsum(_ms_energy(samples, sr))))
+    last = n_ms - min_silence_len
+    starts = np.arange(0, last + 1, seek_step)
+    if last % seek_step:
+        starts = np.append(starts, last)
+    ends = starts + min_silence_len
+    counts = (ends * sr // 1000 - starts * sr // 1000) * samples.shape[1]
+    mean_sq = (csum[ends] - csum[starts]) / counts
+    thresh = (10 ** (silence_thresh / 20.0)) * float(1 << (8 * width - 1))
+    # audioop.rms (what pydub compared) truncates to an integer; floor likewise so windows
+    # right at the threshold fall on the same side
+    silent = starts[np.floor(np.sqrt(mean_sq)) <= thresh]
+    if not len(silent):
+        return [[0, n_ms]]
+
+    # Overlapping silent windows form one silent range; run-length encode them
+    breaks = np.flatnonzero(np.diff(silent) > min_silence_len)
+    range_starts = silent[np.concatenate(([0], breaks + 1))]
+    range_ends = silent[np.concatenate((breaks, [len(silent) - 1]))] + min_silence_len
+
+    # Speech is the complement of the silent ranges
+    bounds = np.concatenate(([0], np.column_stack((range_starts, range_ends)).ravel(), [n_ms]))
+    return [[int(s), int(e)] for s, e in bounds.reshape(-1, 2) if e > s]
+
+def _segments_from_speech(speech, total_ms, pad_ms, fps_hint):
+    """Pad and merge [start_ms, end_ms] speech ranges into alternating silence/speech segment dicts."""
     # expand speech by pad, clamp, sort & merge (tolerance ~ 100 ms)
     # Add extra hold time at the end to prevent snipping
     hold_ms = 500  # 500ms hold at end of speech segments
-    speech = [(max(0, s - pad_ms), min(len(a), e + pad_ms + hold_ms)) for s, e in speech]
+    tail_ms = pad_ms + hold_ms
+    speech = [(max(0, s - pad_ms), min(total_ms, e + tail_ms)) for s, e in speech]
     speech.sort()
     merged = []
+    merge_tol_ms = 100  # Increased from 50ms to 100ms
     for s, e in speech:
-        if merged and s <= merged[-1][1] + 100:  # Increased from 50ms to 100ms
+        if merged and s <= merged[-1][1] + merge_tol_ms:
             merged[-1] = (merged[-1][0], max(merged[-1][1], e))
         else:
             merged.append((s, e))
@@ -43,7 +244,7 @@ def detect_silence(wav_path, min_sil_ms=600, pad_ms=120, out_json=None, silence_
     # Build alternating segments deterministically (no overlap scans)
     pts = [0]
     for s, e in coalesced: pts += [s, e]
-    pts.append(len(a))
+    pts.append(total_ms)
     
     segs = []
     for i in range(len(pts) - 1):
@@ -53,24 +254,83 @@ def detect_silence(wav_path, min_sil_ms=600, pad_ms=120, out_json=None, silence_
         is_silence = (i % 2 == 0)
         segs.append({"start_sec": s/1000.0, "end_sec": e/1000.0, "is_silence": is_silence})
     
-    if out_json:
-        try:
+    return segs
+
+def _write_segments(segs, out_json):
+    """Write segments to out_json, reporting (not raising) failures."""
+    try:
+        if orjson:
+            with open(out_json, "wb") as f:
+                f.write(orjson.dumps(segs, option=orjson.OPT_INDENT_2))
+        else:
             with open(out_json, "w") as f:
                 json.dump(segs, f, indent=2)
-            
-            if not os.path.exists(out_json):
-                print(f"detect_silence: ERROR - Failed to create {out_json}")
+        
+        if not os.path.exists(out_json):
+            print(f"detect_silence: ERROR - Failed to create {out_json}")
+    except Exception as e:
+        print(f"detect_silence: ERROR writing JSON file: {e}")
+        import traceback
+        print(f"detect_silence: Traceback: {traceback.format_exc()}")
+
+def detect_silence(wav_path, min_sil_ms=600, pad_ms=120, out_json=None, silence_thresh_db=-50.0, fps_hint=30,
+                   start_sec=None, end_sec=None, channel=None, backend="numpy", pcm_cache=False):
+    """Detect silence segments in audio file (or its start_sec..end_sec range / one channel) and return segments list.
+    
+    backend "ffmpeg" uses ffmpeg's silencedetect filter (peak-based, so results differ slightly) instead of the windowed RMS scan.
+    pcm_cache keeps ffmpeg-decoded audio in PCM_CACHE between runs (plain WAV is memory-mapped and needs no cache).
+    """
+    if not os.path.exists(wav_path):
+        print(f"detect_silence: ERROR - File does not exist: {wav_path}")
+        return []
+    
+    if backend == "ffmpeg":
+        try:
+            speech, total_ms = _detect_nonsilent_ffmpeg(wav_path, min_sil_ms, silence_thresh_db, start_sec, end_sec, channel)
         except Exception as e:
-            print(f"detect_silence: ERROR writing JSON file: {e}")
-            import traceback
-            print(f"detect_silence: Traceback: {traceback.format_exc()}")
+            print(f"detect_silence: ERROR running ffmpeg silencedetect: {e}")
+            return []
+        segs = _segments_from_speech(speech, total_ms, pad_ms, fps_hint)
+        if out_json:
+            _write_segments(segs, out_json)
+        return segs
+    
+    try:
+        try:
+            samples, sr, width = _read_wav(wav_path, start_sec, end_sec)
+            if channel is not None:
+                samples = samples[:, channel:channel + 1]
+        except (wave.Error, EOFError, KeyError):
+            # Not plain PCM WAV (e.g. float WAV or a compressed source): let ffmpeg decode it
+            read = _read_ffmpeg_cached if pcm_cache else _read_ffmpeg
+            samples, sr, width = read(wav_path, start_sec, end_sec, channel)
+    except Exception as e:
+        print(f"detect_silence: ERROR loading audio file: {e}")
+        return []
+    total_ms = len(samples) * 1000 // sr
     
+    # Settings matching Resolve: -50dB threshold, 150ms min silence
+    speech = _detect_nonsilent(samples, sr, width, min_sil_ms, silence_thresh_db, seek_step=20)
+    segs = _segments_from_speech(speech, total_ms, pad_ms, fps_hint)
+    if out_json:
+        _write_segments(segs, out_json)
     return segs
 
+def analyze_to_json(job):
+    """Process-pool entry point: run detect_silence for one (name, wav_path, out_json, kwargs) job."""
+    name, wav_path, out_json, kwargs = job
+    try:
+        detect_silence(wav_path, out_json=out_json, **kwargs)
+    except Exception as e:
+        print(f"detect_silence: ERROR analyzing {name}: {e}")
+        return name, out_json, False
+    # Segments stay on disk; only the status crosses the process boundary
+    return name, out_json, os.path.exists(out_json)
+
 if __name__ == "__main__":
     # Usage: python3 detect_silence.py <wav> <min_sil_ms> <pad_ms> <out_json>
     wav = sys.argv[1]
     min_sil_ms = int(sys.argv[2]) if len(sys.argv) > 2 else 600
     pad_ms = int(sys.argv[3]) if len(sys.argv) > 3 else 120
     out_json = sys.argv[4] if len(sys.argv) > 4 else None
-    detect_silence(wav, min_sil_ms, pad_ms, out_json)
\ No newline at end of file
+    detect_silence(wav, min_sil_ms, pad_ms, out_json)
@@ -100,12 +100,12 @@ def check_ffmpeg():
         print("✓ ffmpeg is available")
         return True
     except (subprocess.CalledProcessError, FileNotFoundError):
-        print("⚠ ffmpeg not found - pydub will attempt to use system audio libraries")
-        print("  For best performance, install ffmpeg:")
+        print("⚠ ffmpeg not found - only plain PCM WAV renders can be analyzed")
+        print("  To analyze other formats, install ffmpeg:")
         print("  macOS: brew install ffmpeg")
         print("  Windows: Download from https://ffmpeg.org/download.html")
         print("  Linux: sudo apt install ffmpeg (Ubuntu/Debian)")
-        print("  The script will still work without ffmpeg, but may show warnings")
+        print("  The script will still work without ffmpeg using the default WAV preset")
         return True  # Don't fail setup if ffmpeg is missing
 
 def find_preset_directory():
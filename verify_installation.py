@@ -88,12 +88,18 @@ def test_dependencies():
     print("Testing dependencies...")
     
     try:
-        import pydub
-        print("✓ pydub available")
+        import numpy
+        print("✓ numpy available")
     except ImportError:
-        print("✗ pydub not available - run: pip install pydub")
+        print("✗ numpy not available - run: pip install numpy")
         return False
     
+    try:
+        import orjson
+        print("✓ orjson available (fast segment loading)")
+    except ImportError:
+        print("⚠ orjson not available - falling back to json (optional: pip install orjson)")
+    
     try:
         import json
         print("✓ json available")
@@ -111,7 +117,7 @@ def test_dependencies():
     return True
 
 def test_ffmpeg_detection():
-    """Test ffmpeg detection."""
+    """Test ffmpeg detection (optional: only needed for non-PCM-WAV input and the ffmpeg backend)."""
     print("Testing ffmpeg detection...")
     
     try:
@@ -121,16 +127,14 @@ def test_ffmpeg_detection():
                               timeout=5)
         if result.returncode == 0:
             print("✓ ffmpeg available")
-            return True
         else:
-            print("✗ ffmpeg not working properly")
-            return False
+            print("⚠ ffmpeg not working properly - only plain PCM WAV renders can be analyzed")
     except (subprocess.TimeoutExpired, FileNotFoundError):
-        print("✗ ffmpeg not found - install ffmpeg for audio processing")
-        return False
+        print("⚠ ffmpeg not found - only plain PCM WAV renders can be analyzed")
+        print("  ffmpeg is needed only for non-WAV or non-PCM input and for the 'ffmpeg' silence backend")
     except Exception as e:
-        print(f"✗ Error testing ffmpeg: {e}")
-        return False
+        print(f"⚠ Error testing ffmpeg: {e}")
+    return True  # optional: the default WAV preset works without it
 
 def main():
     """Run all installation verification tests."""